@@ -0,0 +1,17 @@
+from rich.console import Console
+from rich.style import Style
+
+
+# Styles shared across commands, parsed once rather than on every render.
+BORDER_STYLE = Style.parse("bright_blue")
+TABLE_HEADER_STYLE = Style.parse("bold magenta")
+
+_console = None
+
+
+def get_console():
+    """Return the Rich console shared by the CLI, creating it on first use."""
+    global _console
+    if _console is None:
+        _console = Console()
+    return _console
@@ -1,15 +1,19 @@
-import typer
+import hashlib
+import os
+from importlib.metadata import version
+from importlib.resources import files
 from pathlib import Path
-from rich.console import Console
+
+import typer
 from rich.markdown import Markdown
 from rich.panel import Panel
 
 from trogon.typer import init_tui
 
+from ._console import BORDER_STYLE, get_console
+from .config import CACHE_DIR
 from .hello import hello
 from .info import info_app
-from .example_1 import main as example1_main
-from .example_2 import main as example2_main
 
 app = typer.Typer(
     name="supriya music",
@@ -20,16 +24,17 @@ app.add_typer(
     info_app, name="info", help="Display information about Supriya Music Toolkit."
 )
 
-console = Console()
-
 app.command(name="hello")(hello)
 
 
 @app.command()
 def example_1():
     """Launch the PyQt6 GUI for real-time synth control."""
+    console = get_console()
     try:
         # Import here to avoid PyQt6 dependency when not using GUI
+        from .example_1 import main as example1_main
+
         exit_code = example1_main()
         if exit_code != 0:
             console.print(
@@ -50,8 +55,11 @@ def example_1():
 @app.command()
 def example_2():
     """Launch the PyQt6 GUI for noise-modulated synth control."""
+    console = get_console()
     try:
         # Import here to avoid PyQt6 dependency when not using GUI
+        from .example_2 import main as example2_main
+
         exit_code = example2_main()
         if exit_code != 0:
             console.print(
@@ -69,35 +77,104 @@ def example_2():
         raise typer.Exit(1)
 
 
-@app.callback(invoke_without_command=True)
-def main(ctx: typer.Context):
-    """Main callback that runs greet by default when no command is specified."""
-    if ctx.invoked_subcommand is None:
-        # Read and render the README.md file
-        readme_path = Path(__file__).parent / "README.md"
+# Rendered README panels are cached on disk, keyed by the README file and the
+# console configuration (see _readme_cache_path).
+README_CACHE_DIR = Path(CACHE_DIR)
 
-        try:
-            readme_content = readme_path.read_text()
-            markdown = Markdown(readme_content)
+# Parsed README.md, loaded on first use and reused for later renders.
+_README_MD = None
 
-            # Display the README with a panel
-            console.print(
-                Panel(
-                    markdown,
-                    title="🎵 Supriya Music Toolkit",
-                    border_style="bright_blue",
-                    padding=(1, 2),
-                )
-            )
 
+def _readme_markdown():
+    """Return the package README parsed as Markdown, or None if it is missing."""
+    global _README_MD
+    if _README_MD is None:
+        try:
+            readme_content = files(__package__).joinpath("README.md").read_text()
         except FileNotFoundError:
-            console.print(
-                Panel(
-                    "Welcome to Supriya Music!\n\nThis toolkit provides basic examples for using the Supriya system.",
-                    title="🎵 Supriya Music Toolkit",
-                    border_style="bright_blue",
-                )
-            )
+            return None
+        _README_MD = Markdown(readme_content)
+    return _README_MD
+
+
+def _readme_panel():
+    """Build the panel shown when no command is given."""
+    markdown = _readme_markdown()
+    if markdown is not None:
+        # Display the README with a panel
+        return Panel(
+            markdown,
+            title="🎵 Supriya Music Toolkit",
+            border_style=BORDER_STYLE,
+            padding=(1, 2),
+        )
+    return Panel(
+        "Welcome to Supriya Music!\n\nThis toolkit provides basic examples for using the Supriya system.",
+        title="🎵 Supriya Music Toolkit",
+        border_style=BORDER_STYLE,
+    )
+
+
+def _readme_cache_path(console, readme_path, readme_stat):
+    """Return the cache file for this README rendered by ``console``.
+
+    The key covers the README's resolved path, mtime and size as well as the
+    console settings, so installs sharing the per-user cache never replay each
+    other's README and any edit produces a new key.
+    """
+    key = repr(
+        (
+            os.path.realpath(readme_path),
+            readme_stat.st_mtime_ns,
+            readme_stat.st_size,
+            console.width,
+            console.color_system,
+            console.no_color,
+            console.legacy_windows,
+            console.encoding,
+            version("rich"),
+        )
+    )
+    return README_CACHE_DIR / f"readme-{hashlib.sha256(key.encode()).hexdigest()[:16]}.ansi"
+
+
+def _print_readme(console):
+    """Print the README panel, reusing the cached rendering when there is one."""
+    readme_path = files(__package__).joinpath("README.md")
+    try:
+        cache_path = _readme_cache_path(console, readme_path, os.stat(readme_path))
+    except (OSError, TypeError):
+        # Missing, or not a real file (e.g. a zipped install), so don't cache
+        cache_path = None
+
+    if cache_path is not None:
+        try:
+            console.file.write(cache_path.read_text(encoding="utf-8"))
+            console.file.flush()
+            return
+        except OSError:
+            pass
+
+    with console.capture() as capture:
+        console.print(_readme_panel())
+    rendered = capture.get()
+    console.file.write(rendered)
+    console.file.flush()
+
+    if cache_path is not None:
+        try:
+            README_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            cache_path.write_text(rendered, encoding="utf-8")
+        except OSError:
+            pass
+
+
+@app.callback(invoke_without_command=True)
+def main(ctx: typer.Context):
+    """Main callback that runs greet by default when no command is specified."""
+    if ctx.invoked_subcommand is None:
+        # Render the README.md file
+        _print_readme(get_console())
 
 
 init_tui(app)
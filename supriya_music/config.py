@@ -1,19 +1,148 @@
+import hashlib
+import json
 import logging
 import os
 import yaml
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    # PyYAML was built without libyaml, so parsing runs in pure Python
+    from yaml import SafeLoader
+
+
+JSON_CONFIG_PATH = os.path.join(os.getcwd(), "supriya.config.json")
+YAML_CONFIG_PATH = os.path.join(os.getcwd(), "supriya.config.yaml")
+
+# Per-user cache for derived data such as the parsed YAML configuration.
+CACHE_DIR = os.path.join(
+    os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache"),
+    "supriya_music",
+)
 
+# Candidate configuration files, in order of preference. A JSON configuration
+# is preferred over YAML since it is much faster to parse.
 SUPRIYA_CONFIG_PATH = os.environ.get("SUPRIYA_CONFIG_PATH")
-if SUPRIYA_CONFIG_PATH and os.path.exists(SUPRIYA_CONFIG_PATH):
-    CONFIG_PATH = SUPRIYA_CONFIG_PATH
-else:
-    CONFIG_PATH = os.path.join(os.getcwd(), "supriya.config.yaml")
+CONFIG_PATHS = [
+    path
+    for path in (SUPRIYA_CONFIG_PATH, JSON_CONFIG_PATH, YAML_CONFIG_PATH)
+    if path
+]
+
+
+def load_json(data):
+    """Parse JSON ``data`` (bytes or str), using orjson when it is installed."""
+    try:
+        import orjson
+    except ImportError:
+        return json.loads(data)
+    return orjson.loads(data)
+
+
+def dump_json(config):
+    """Serialize ``config`` as indented JSON bytes, using orjson when it is installed."""
+    try:
+        import orjson
+    except ImportError:
+        return json.dumps(config, indent=2).encode()
+    return orjson.dumps(config, option=orjson.OPT_INDENT_2)
+
+
+def json_representable(config):
+    """Return True if ``config`` survives a round trip through JSON unchanged."""
+    try:
+        return json.loads(json.dumps(config)) == config
+    except (TypeError, ValueError):
+        return False
+
+
+def _yaml_load(data):
+    """Parse YAML ``data`` (bytes or str) with the fastest available safe loader."""
+    return yaml.load(data, Loader=SafeLoader)
+
+
+def _open_config():
+    """Open the first candidate configuration file that exists.
+
+    Opening directly (rather than checking ``os.path.exists`` first) costs a
+    single syscall per candidate. Raises ``FileNotFoundError`` for the last
+    candidate if none exist.
+    """
+    for path in CONFIG_PATHS[:-1]:
+        try:
+            return path, open(path, "rb")
+        except FileNotFoundError:
+            pass
+    return CONFIG_PATHS[-1], open(CONFIG_PATHS[-1], "rb")
+
+
+# Parsed YAML configuration is cached as JSON in CACHE_DIR, keyed by the
+# config's absolute path and reused until the file's mtime changes. JSON is
+# used so that a cache file can never execute code when loaded.
+def _cache_path(config_path):
+    key = hashlib.sha256(os.path.abspath(config_path).encode()).hexdigest()
+    return os.path.join(CACHE_DIR, f"config-{key}.json")
+
+
+def _load_cached_config(cache_path, config_mtime_ns):
+    try:
+        with open(cache_path, "rb") as cache_file:
+            cached = json.loads(cache_file.read())
+    except (OSError, ValueError):
+        return None
+    if not isinstance(cached, dict) or cached.get("mtime_ns") != config_mtime_ns:
+        return None
+    return cached.get("config")
+
+
+def _store_cached_config(cache_path, config_mtime_ns, config):
+    if not json_representable(config):
+        # e.g. non-string keys, which JSON would silently turn into strings
+        return
+    data = json.dumps({"mtime_ns": config_mtime_ns, "config": config})
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(cache_path, "w", encoding="utf-8") as cache_file:
+            cache_file.write(data)
+    except OSError as e:
+        logging.debug(f"Could not write configuration cache {cache_path}: {e}")
+
+
+def _load_config(config_path, config_file):
+    if config_path.endswith(".json"):
+        if config_path == JSON_CONFIG_PATH and os.path.exists(YAML_CONFIG_PATH):
+            logging.warning(
+                f"Both {JSON_CONFIG_PATH} and {YAML_CONFIG_PATH} exist, the JSON "
+                "configuration is used and the YAML one is ignored. Remove one of them."
+            )
+        return load_json(config_file.read())
+
+    cache_path = _cache_path(config_path)
+    config_mtime_ns = os.fstat(config_file.fileno()).st_mtime_ns
+    config = _load_cached_config(cache_path, config_mtime_ns)
+    if config is None:
+        # The loader accepts the raw bytes and handles decoding itself
+        # An empty file parses to None, treat it as an empty configuration
+        config = _yaml_load(config_file.read()) or {}
+        _store_cached_config(cache_path, config_mtime_ns, config)
+        # Shown only when the YAML is (re)parsed, i.e. once per edit, and only
+        # for configs that convert-config can actually convert (and cache)
+        if config and json_representable(config):
+            logging.warning(
+                f"Loaded YAML configuration from {config_path}, run "
+                "'supriya_music info convert-config' to convert it to faster-loading JSON."
+            )
+    return config
+
 
+CONFIG_PATH = YAML_CONFIG_PATH
 try:
-    with open(CONFIG_PATH, "r") as config_file:
-        CONFIG = yaml.safe_load(config_file)
-except (FileNotFoundError, Exception) as e  :
-    logging.warning(
-        f"Could not load configuration from {CONFIG_PATH}: {e}"
-    )
+    CONFIG_PATH, _config_file = _open_config()
+    with _config_file:
+        CONFIG = _load_config(CONFIG_PATH, _config_file)
+except FileNotFoundError:
+    logging.info(f"No configuration found at {CONFIG_PATH}, using defaults.")
     CONFIG = {}
+except (yaml.YAMLError, json.JSONDecodeError) as e:
+    logging.error(f"Malformed configuration {CONFIG_PATH}: {e}")
+    raise SystemExit(2)
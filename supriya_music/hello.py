@@ -1,90 +1,259 @@
+import hashlib
+import inspect
 import sys
 import time
+from pathlib import Path
 
-import supriya
-from supriya import Envelope, synthdef
-from supriya.exceptions import ServerCannotBoot
-from supriya.ugens import EnvGen, Out, SinOsc
-from rich.console import Console
 from rich.panel import Panel
+from rich.style import Style
+from rich.text import Text
 from rich.tree import Tree
 
-from .config import CONFIG, CONFIG_PATH
+from ._console import BORDER_STYLE, get_console
+from .config import CACHE_DIR, CONFIG, CONFIG_PATH
+
+# Used when no audio configuration is found. Without an explicit hardware
+# buffer size scsynth falls back to the device default, which can be very
+# high-latency (or silent) on some PortAudio backends.
+DEFAULT_AUDIO_OPTIONS = {"hardware_buffer_size": 256}
+
+# Seconds between sending a bundle and the time it is scheduled to play at.
+SCHEDULE_AHEAD = 0.1
+
+# Precompiled synthdefs, written by 'supriya_music info compile'. When present
+# scsynth reads them straight from disk instead of having them sent over OSC.
+SYNTHDEF_CACHE_DIR = Path(CACHE_DIR) / "synthdefs"
+
+# Compiled simple_sine synthdef, built on first use so that importing this
+# module does not import supriya.
+_SIMPLE_SINE = None
+
+
+def _get_simple_sine():
+    """Return the simple_sine synthdef, defining it on first call."""
+    global _SIMPLE_SINE
+    if _SIMPLE_SINE is None:
+        from supriya import Envelope, synthdef
+        from supriya.ugens import EnvGen, Out, SinOsc
+
+        @synthdef()
+        def simple_sine(frequency=440, amplitude=0.1, gate=1):
+            sine = SinOsc.ar(frequency=frequency) * amplitude
+            envelope = EnvGen.kr(envelope=Envelope.adsr(), gate=gate, done_action=2)
+            Out.ar(bus=0, source=[sine * envelope] * 2)
+
+        _SIMPLE_SINE = simple_sine
+    return _SIMPLE_SINE
+
+
+def _simple_sine_path():
+    """Return where the precompiled simple_sine for the current definition lives.
+
+    The file name carries a hash of _get_simple_sine's source and the supriya
+    version, so an edited synthdef never matches a stale file and freshness is
+    decided without compiling. Returns None if the source is unavailable.
+    """
+    import supriya
+
+    try:
+        source = inspect.getsource(_get_simple_sine)
+    except (OSError, TypeError):
+        return None
+    version = getattr(supriya, "__version__", "")
+    key = hashlib.sha256(f"{version}\n{source}".encode()).hexdigest()[:16]
+    return SYNTHDEF_CACHE_DIR / f"simple_sine-{key}.scsyndef"
+
+
+def compile_synthdefs():
+    """Write the compiled simple_sine synthdef to the synthdef cache and return its path."""
+    path = _simple_sine_path()
+    if path is None:
+        raise OSError("simple_sine source is not available to key the compiled file")
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(_get_simple_sine().compile())
+    return path
+
+
+def _print_latency(console, server):
+    """Report the hardware buffer latency the server booted with."""
+    buffer_size = server.options.hardware_buffer_size
+    if not buffer_size:
+        console.print(
+            "[yellow]No hardware_buffer_size set, scsynth will pick the device default "
+            "which can be high-latency. Set audio.hardware_buffer_size in your "
+            "configuration to control it.[/yellow]"
+        )
+        return
+    status = server.status
+    sample_rate = status.actual_sample_rate if status else server.options.sample_rate
+    if sample_rate:
+        console.print(f"Latency: {buffer_size / sample_rate * 1000:.1f} ms")
 
 
 def _explain():
     """Explain the steps that the hello function performs using Rich formatting."""
-    console = Console()
-
-    # Create a tree structure to show the process
-    tree = Tree("🎵 [bold blue]Supriya Hello Example Steps[/bold blue]")
-
-    # Server setup
-    server_branch = tree.add("🖥️  [bold green]Server Setup[/bold green]")
-    server_branch.add("Create Supriya server instance")
-    server_branch.add("Boot SuperCollider synthesis server (scsynth)")
-
-    # SynthDef creation
-    synthdef_branch = tree.add("🔧 [bold yellow]SynthDef Creation[/bold yellow]")
-    synthdef_branch.add("Define [cyan]simple_sine[/cyan] synthdef with parameters:")
-    params_branch = synthdef_branch.add("Parameters:")
-    params_branch.add("[magenta]frequency[/magenta] = 440 Hz (default)")
-    params_branch.add("[magenta]amplitude[/magenta] = 0.1 (volume)")
-    params_branch.add("[magenta]gate[/magenta] = 1 (envelope trigger)")
-
-    audio_branch = synthdef_branch.add("Audio signal chain:")
-    audio_branch.add("SinOsc.ar() → Generate sine wave")
-    audio_branch.add("EnvGen.kr() → Apply ADSR envelope")
-    audio_branch.add("Out.ar() → Output to speakers (stereo)")
-
-    # Synthesis process
-    synth_branch = tree.add("🎶 [bold cyan]Synthesis Process[/bold cyan]")
-    synth_branch.add("Add synthdef to server")
-    synth_branch.add("Synchronize server state")
-    synth_branch.add("Create group to organize synths")
-
-    play_branch = synth_branch.add("Play sequence:")
-    play_branch.add("Create synth at 220 Hz (A3)")
-    play_branch.add("Create synth at 440 Hz (A4) - one octave higher")
-    play_branch.add("Create synth at 880 Hz (A5) - two octaves higher")
-    play_branch.add("Each synth plays for 1 second")
-
-    cleanup_branch = synth_branch.add("Cleanup:")
-    cleanup_branch.add("Free each synth individually")
-    cleanup_branch.add("Wait 1 second between each release")
-
-    # Server teardown
-    teardown_branch = tree.add("🔚 [bold red]Server Teardown[/bold red]")
-    teardown_branch.add("Quit SuperCollider server")
-    teardown_branch.add("Clean up resources")
+    console = get_console()
+    if not console.is_terminal:
+        # Output is piped or redirected, so skip the Panel/Tree layout
+        console.file.write(_explanation_plain_text())
+        console.file.flush()
+        return
+    _render_explanation(console)
+
+
+# Heading styles for the explanation tree, parsed once.
+_BLUE = Style.parse("bold blue")
+_GREEN = Style.parse("bold green")
+_YELLOW = Style.parse("bold yellow")
+_CYAN = Style.parse("bold cyan")
+_RED = Style.parse("bold red")
+
+# The steps hello() performs, as (label, children) nodes where each child is
+# either a plain label or another node.
+_EXPLAIN_STRUCTURE = (
+    Text.assemble("🎵 ", ("Supriya Hello Example Steps", _BLUE)),
+    [
+        (
+            Text.assemble("🖥️  ", ("Server Setup", _GREEN)),
+            [
+                "Create Supriya server instance",
+                "Boot SuperCollider synthesis server (scsynth)",
+            ],
+        ),
+        (
+            Text.assemble("🔧 ", ("SynthDef Creation", _YELLOW)),
+            [
+                "Define [cyan]simple_sine[/cyan] synthdef with parameters:",
+                (
+                    "Parameters:",
+                    [
+                        "[magenta]frequency[/magenta] = 440 Hz (default)",
+                        "[magenta]amplitude[/magenta] = 0.1 (volume)",
+                        "[magenta]gate[/magenta] = 1 (envelope trigger)",
+                    ],
+                ),
+                (
+                    "Audio signal chain:",
+                    [
+                        "SinOsc.ar() → Generate sine wave",
+                        "EnvGen.kr() → Apply ADSR envelope",
+                        "Out.ar() → Output to speakers (stereo)",
+                    ],
+                ),
+            ],
+        ),
+        (
+            Text.assemble("🎶 ", ("Synthesis Process", _CYAN)),
+            [
+                "Add synthdef to server",
+                "Synchronize server state",
+                "Create group to organize synths",
+                (
+                    "Play sequence:",
+                    [
+                        "Create synth at 220 Hz (A3)",
+                        "Create synth at 440 Hz (A4) - one octave higher",
+                        "Create synth at 880 Hz (A5) - two octaves higher",
+                        "Each synth plays for 1 second",
+                    ],
+                ),
+                (
+                    "Cleanup:",
+                    [
+                        "Free each synth individually",
+                        "Wait 1 second between each release",
+                    ],
+                ),
+            ],
+        ),
+        (
+            Text.assemble("🔚 ", ("Server Teardown", _RED)),
+            [
+                "Quit SuperCollider server",
+                "Clean up resources",
+            ],
+        ),
+    ],
+)
+
+_EXPLAIN_NOTES = (
+    "• [cyan]SinOsc.ar()[/cyan] - Audio rate sine wave oscillator",
+    "• [cyan]EnvGen.kr()[/cyan] - Control rate envelope generator",
+    "• [cyan]ADSR[/cyan] - Attack, Decay, Sustain, Release envelope",
+    "• [cyan]done_action=2[/cyan] - Free the synth when envelope completes",
+    "• [cyan]Frequencies[/cyan] - Each octave doubles the frequency",
+)
+
+
+def _build_tree(parent, children):
+    """Add ``children`` (labels or (label, children) nodes) under ``parent``."""
+    for child in children:
+        if isinstance(child, tuple):
+            label, grandchildren = child
+            _build_tree(parent.add(label), grandchildren)
+        else:
+            parent.add(child)
+
+
+def _plain(label):
+    """Return ``label`` (markup string or Text) without any styling."""
+    if isinstance(label, Text):
+        return label.plain
+    return Text.from_markup(label).plain
+
+
+def _plain_outline(children, depth=0):
+    """Yield indented plain-text lines for explanation ``children``."""
+    for child in children:
+        label, grandchildren = child if isinstance(child, tuple) else (child, ())
+        yield "  " * depth + "- " + _plain(label)
+        yield from _plain_outline(grandchildren, depth + 1)
+
+
+def _explanation_plain_text():
+    """Return the explanation as an indented plain-text outline."""
+    label, children = _EXPLAIN_STRUCTURE
+    lines = [
+        _plain(label),
+        *_plain_outline(children),
+        "",
+        "Technical Notes:",
+        *(_plain(note) for note in _EXPLAIN_NOTES),
+    ]
+    return "\n".join(lines) + "\n"
+
+
+def _render_explanation(console):
+    """Print the hello explanation tree and technical notes to ``console``."""
+    label, children = _EXPLAIN_STRUCTURE
+    tree = Tree(label)
+    _build_tree(tree, children)
 
     # Display the explanation
     console.print(
         Panel(
             tree,
             title="🎵 Supriya Hello Example Explanation",
-            border_style="bright_blue",
+            border_style=BORDER_STYLE,
             padding=(1, 2),
         )
     )
 
     # Additional technical details
     console.print("\n[bold]Technical Notes:[/bold]")
-    console.print("• [cyan]SinOsc.ar()[/cyan] - Audio rate sine wave oscillator")
-    console.print("• [cyan]EnvGen.kr()[/cyan] - Control rate envelope generator")
-    console.print("• [cyan]ADSR[/cyan] - Attack, Decay, Sustain, Release envelope")
-    console.print(
-        "• [cyan]done_action=2[/cyan] - Free the synth when envelope completes"
-    )
-    console.print("• [cyan]Frequencies[/cyan] - Each octave doubles the frequency")
+    for note in _EXPLAIN_NOTES:
+        console.print(note)
 
 
 def hello(explain: bool = False):
-    console = Console()
+    console = get_console()
     if explain:
         _explain()
         return
 
+    import supriya
+    from supriya.exceptions import ServerCannotBoot
+
     # Construct a Supriya server
 
     # Boot the server - Start a SCSynth process
@@ -109,38 +278,70 @@ def hello(explain: bool = False):
             sys.exit(1)
     else:
         console.print(
-            "No audio configuration found, booting server with default options."
+            "No audio configuration found, booting server with low-latency default options."
         )
-        server = supriya.Server()
-        server.boot()
-
-    # Define a simple sine wave synthdef
-    @synthdef()
-    def simple_sine(frequency=440, amplitude=0.1, gate=1):
-        sine = SinOsc.ar(frequency=frequency) * amplitude
-        envelope = EnvGen.kr(envelope=Envelope.adsr(), gate=gate, done_action=2)
-        Out.ar(bus=0, source=[sine * envelope] * 2)
+        options = supriya.Options(**DEFAULT_AUDIO_OPTIONS)
+        try:
+            server = supriya.Server()
+            server.boot(options=options)
+        except ServerCannotBoot:
+            # Some devices reject the small buffer, fall back to scsynth's own
+            console.print(
+                "[yellow]Failed to boot with low-latency options, retrying with scsynth defaults.[/yellow]"
+            )
+            try:
+                server = supriya.Server()
+                server.boot(options=supriya.Options())
+            except ServerCannotBoot:
+                console.print("[bold red]Failed to boot server with default options.[/bold red]")
+                console.print(
+                    "[bold red]For more information try running 'supriya_music info devices' (`python -m supriya_music info devices`) to "
+                    "list available audio devices.[/bold red]"
+                )
+                sys.exit(1)
 
     try:
-        # Add the synthdef to the server
-        server.add_synthdefs(simple_sine)
+        _print_latency(console, server)
+
+        # add_synth() still needs the SynthDef object for its controls, but
+        # with a precompiled file it is never compiled client side
+        simple_sine = _get_simple_sine()
+        simple_sine_path = _simple_sine_path()
+
+        # Send the setup as a single bundle so only one sync round trip is needed
+        with server.at():
+            # Add the synthdef to the server, preferring the precompiled file
+            if simple_sine_path is not None and simple_sine_path.exists():
+                server.load_synthdefs(simple_sine_path)
+            else:
+                server.add_synthdefs(simple_sine)
+
+            # Create a group to hold the synths
+            group = server.add_group()
 
         # Ensure the server is synchronized
         server.sync()
 
-        # Create a group to hold the synths
-        group = server.add_group()
+        # Schedule everything up front as timestamped bundles, one second
+        # apart, so scsynth performs each step on time without us blocking
+        start = time.time() + SCHEDULE_AHEAD
 
         # Create and play multiple synths with different frequencies
+        synths = []
         for i in range(3):
             freq = 220 * (2**i)
-            synth = group.add_synth(simple_sine, frequency=freq, amplitude=0.1)
-            time.sleep(1)
+            with server.at(start + i):
+                synth = group.add_synth(simple_sine, frequency=freq, amplitude=0.1)
+            synths.append(synth)
 
         # Free each synth after a delay
-        for synth in group.children:
-            synth.free()
-            time.sleep(1)
+        for i, synth in enumerate(synths, start=3):
+            with server.at(start + i):
+                synth.free()
+
+        # Wait for the scheduled sequence to finish before quitting
+        time.sleep(max(0.0, start + 6 - time.time()))
+        server.sync()
     finally:
         # Quit the server
         server.quit()
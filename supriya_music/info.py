@@ -1,10 +1,10 @@
+import os
+from functools import cache
+
 import typer
-from rich.console import Console
 from rich.table import Table
 
-import pandas as pd
-import sounddevice as sd
-import supriya.scsynth
+from ._console import TABLE_HEADER_STYLE, get_console
 
 
 info_app = typer.Typer(
@@ -13,37 +13,110 @@ info_app = typer.Typer(
 )
 
 
-console = Console()
+@cache
+def _scsynth_location():
+    """Locate the scsynth binary, searching PATH at most once per process."""
+    import supriya.scsynth
+
+    return supriya.scsynth.find()
 
 
 @info_app.callback(invoke_without_command=True)
 def info(ctx: typer.Context):
+    console = get_console()
     console.print("[bold green]Supriya Music Toolkit[/bold green]")
     console.print("Version: [cyan]1.0.0[/cyan]")
     console.print(
         "Description: [cyan]A toolkit for music synthesis and algorithmic composition using Supriya.[/cyan]"
     )
-    scsynth_location = supriya.scsynth.find()
+    scsynth_location = _scsynth_location()
     console.print(f"scsynth Location: [cyan]{scsynth_location}[/cyan]")
 
 
+def _format_cell(value):
+    if isinstance(value, float):
+        return f"{value:.2f}"
+    return str(value)
+
+
 @info_app.command(name="devices")
 def devices(
     columns: list[str] = typer.Option(
         None, "--columns", "-c", help="Specify columns to display."
     )
 ):
+    import sounddevice as sd
+
+    console = get_console()
     console.print("[bold green]Audio Devices[/bold green]")
     devices = list(sd.query_devices())
 
-    df = pd.DataFrame(devices)
-    df = df.round(2)
-    if columns:
-        df = df[columns]
-    table = Table(show_header=True, header_style="bold magenta")
-    for col in df.columns:
-        col_name = "\n".join(col.split("_"))
-        table.add_column(col_name)
-    for _, row in df.iterrows():
-        table.add_row(*[str(row[col]) for col in df.columns])
+    keys = columns or (list(devices[0].keys()) if devices else [])
+    unknown = [key for key in keys if devices and key not in devices[0]]
+    if unknown:
+        raise typer.BadParameter(
+            f"Unknown column(s): {', '.join(unknown)}", param_hint="--columns"
+        )
+    table = Table(show_header=True, header_style=TABLE_HEADER_STYLE)
+    for key in keys:
+        table.add_column("\n".join(key.split("_")))
+    for device in devices:
+        table.add_row(*[_format_cell(device[key]) for key in keys])
     console.print(table)
+
+
+@info_app.command(name="convert-config")
+def convert_config():
+    """Convert the YAML configuration to JSON, which loads much faster."""
+    from .config import (
+        CONFIG,
+        CONFIG_PATH,
+        JSON_CONFIG_PATH,
+        dump_json,
+        json_representable,
+    )
+
+    console = get_console()
+    if CONFIG_PATH.endswith(".json"):
+        console.print(f"Configuration is already JSON: [cyan]{CONFIG_PATH}[/cyan]")
+        return
+    if not CONFIG:
+        console.print(f"[bold red]No configuration loaded from {CONFIG_PATH}.[/bold red]")
+        raise typer.Exit(1)
+
+    if not json_representable(CONFIG):
+        console.print(
+            f"[bold red]Configuration in {CONFIG_PATH} cannot be represented as JSON "
+            "(e.g. it has non-string keys), keep using YAML.[/bold red]"
+        )
+        raise typer.Exit(1)
+
+    json_path = os.path.splitext(CONFIG_PATH)[0] + ".json"
+    try:
+        with open(json_path, "wb") as json_file:
+            json_file.write(dump_json(CONFIG))
+    except (TypeError, OSError) as e:
+        console.print(f"[bold red]Could not write JSON configuration: {e}[/bold red]")
+        raise typer.Exit(1)
+    console.print(f"Wrote JSON configuration to [cyan]{json_path}[/cyan]")
+    if json_path != JSON_CONFIG_PATH:
+        console.print(f"Set SUPRIYA_CONFIG_PATH={json_path} to use it.")
+    else:
+        console.print(
+            f"[yellow]{CONFIG_PATH} is no longer read, edit the JSON file from now on "
+            "or remove it to go back to YAML.[/yellow]"
+        )
+
+
+@info_app.command(name="compile")
+def compile_command():
+    """Precompile the example synthdefs to .scsyndef files."""
+    from .hello import compile_synthdefs
+
+    console = get_console()
+    try:
+        path = compile_synthdefs()
+    except OSError as e:
+        console.print(f"[bold red]Could not write compiled synthdef: {e}[/bold red]")
+        raise typer.Exit(1)
+    console.print(f"Wrote compiled synthdef to [cyan]{path}[/cyan]")